@@ -1,37 +1,61 @@
 # coding: utf-8
+from __future__ import print_function
 import sys
 import os,os.path
 import signal
 from p2_opts import Parser, Option, BooleanOption, IntOption
-from p2_web import p2_main
 
-PROOT=os.environ["PROOT"]
+PROOT = os.environ.get("PROOT")
 
 if not PROOT:
-    print "root_path variable is not configured in /etc/rnet.conf"
-    sys.exit(0)
+    sys.stderr.write("root_path variable is not configured in /etc/rnet.conf\n")
+    sys.exit(1)
+
+WEB_DIR = PROOT + "/web"
+PID_FILE = PROOT + "/var/rnet.pid"
+
+def read_pid(path):
+    try:
+        fd = os.open(path, os.O_RDONLY)
+    except OSError:
+        return None
+    try:
+        return int(os.read(fd, 32))
+    finally:
+        os.close(fd)
+
+def do_start(options):
+    print("Starting rnet server")
+    os.chdir(WEB_DIR)
+    from p2_web import p2_main
+    p2_main(PROOT, options)
+
+def do_stop(options):
+    print("Stopping rnet webserver")
+    pid = read_pid(PID_FILE)
+    if pid is not None:
+        os.kill(pid, signal.SIGTERM)
+    else:
+        print("None found")
+
+def do_usage(options):
+    print("Unknown command, try pweb2 start or pweb2 stop")
 
-os.chdir("%s/web"%PROOT)
+COMMANDS = {"start": do_start, "stop": do_stop}
+
+if len(sys.argv) > 1 and sys.argv[1] == "stop":
+    do_stop(None)
+    sys.exit(0)
 
 parser = Parser(options={
-       "daemon":BooleanOption("d","daemon", default=False,short_description=u"Запустить сервер в фоне"),
-       "uid":IntOption("u", "uid", default=1000, short_description=u"UID для привилегий сервера"),
-       "gid":IntOption("g", "gid", default=1000, short_description=u"GID для привилегий сервера")
+       "daemon":lambda: BooleanOption("d","daemon", default=False,short_description=u"Запустить сервер в фоне"),
+       "uid":lambda: IntOption("u", "uid", default=1000, short_description=u"UID для привилегий сервера"),
+       "gid":lambda: IntOption("g", "gid", default=1000, short_description=u"GID для привилегий сервера")
 })
 options, arguments = parser.evaluate()
 
 if len(arguments) == 0:
-    print "Try pweb start2 or pweb2 stop"
+    print("Try pweb start2 or pweb2 stop")
     sys.exit(0)
-if arguments[0] == "start":
-    print "Starting rnet server"
-    p2_main(PROOT, options)    
-elif arguments[0] == "stop":
-    print "Stopping rnet webserver"
-    if os.path.isfile("%s/var/rnet.pid"%PROOT):
-        os.kill(int(open("%s/var/rnet.pid"%PROOT).read()), signal.SIGTERM)
-    else:
-        print "None found"
-else:
-    print "Unknown command, try pweb2 start or pweb2 stop"
+COMMANDS.get(arguments[0], do_usage)(options)
 #
\ No newline at end of file
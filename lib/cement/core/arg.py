@@ -7,14 +7,20 @@ from ..core import backend, interface, handler
 
 LOG = backend.minimal_logger(__name__)
 
+_IARGUMENT_MEMBERS = (
+    '_setup',
+    'parse',
+    'add_argument',
+    )
+
 def argument_validator(klass, obj):
     """Validates a handler implementation against the IArgument interface."""
-    members = [
-        '_setup',
-        'parse',
-        'add_argument',
-        ]
-    interface.validate(IArgument, obj, members)
+    # only validate each handler class once, subclasses are checked on their
+    # own since the flag is looked up in the class __dict__ only
+    if obj.__class__.__dict__.get('_cement_validated') is IArgument:
+        return
+    interface.validate(IArgument, obj, _IARGUMENT_MEMBERS)
+    obj.__class__._cement_validated = IArgument
     
 class IArgument(interface.Interface):
     """
@@ -109,6 +115,3 @@ class CementArgumentHandler(handler.CementBaseHandler):
         
         interface = IArgument
         """The interface that this class implements."""
-        
-    def __init__(self, *args, **kw):
-        super(CementArgumentHandler, self).__init__(*args, **kw)
@@ -1,23 +1,42 @@
 """Cement core config module."""
 
+import os
+from collections import OrderedDict
 from ..core import exc, backend, interface, handler
 
+PARSE_CACHE_SIZE = 64
+"""The maximum number of parsed config files kept by CementConfigHandler."""
+
+_ICONFIG_MEMBERS = (
+    '_setup',
+    'keys', 
+    '__contains__',
+    'has_key',
+    'get_sections', 
+    'get_section_dict',
+    'get', 
+    'set', 
+    'parse_file', 
+    'merge',
+    'add_section',
+    'has_section',
+    )
+
+def _file_version(stat):
+    """
+    Return what identifies a version of a file for the parse cache, using
+    nanosecond modification times where the platform provides them.
+    """
+    return (getattr(stat, 'st_mtime_ns', stat.st_mtime), stat.st_size)
+
 def config_validator(klass, obj):
     """Validates a handler implementation against the IConfig interface."""
-    members = [
-        '_setup',
-        'keys', 
-        'has_key',
-        'get_sections', 
-        'get_section_dict',
-        'get', 
-        'set', 
-        'parse_file', 
-        'merge',
-        'add_section',
-        'has_section',
-        ]
-    interface.validate(IConfig, obj, members)
+    # only validate each handler class once, subclasses are checked on their
+    # own since the flag is looked up in the class __dict__ only
+    if obj.__class__.__dict__.get('_cement_validated') is IConfig:
+        return
+    interface.validate(IConfig, obj, _ICONFIG_MEMBERS)
+    obj.__class__._cement_validated = IConfig
     
 class IConfig(interface.Interface):
     """
@@ -92,6 +111,29 @@ class IConfig(interface.Interface):
         
         """
             
+    def __contains__(item):
+        """
+        Return whether `item` exists in the configuration.  This allows 
+        ``(section, key) in config`` as well as ``section in config``.
+        
+        :param item: Either a (section, key) tuple or a section label.
+        :returns: True if the key (or section) exists, False otherwise.
+        :rtype: boolean
+        
+        """
+        
+    def has_key(section, key):
+        """
+        Return whether or not `section` has the given `key`.  Equivalent to 
+        ``(section, key) in config``.
+        
+        :param section: The config [section] to look in.
+        :param key: The configuration key to test for.
+        :returns: True if the config `section` has `key`.
+        :rtype: boolean
+        
+        """
+            
     def get_sections():
         """
         Return a list of configuration sections.  These are designated by a
@@ -183,6 +225,70 @@ class CementConfigHandler(handler.CementBaseHandler):
         interface = IConfig
         """The interface that this handler implements."""
         
-    def __init__(self, *args, **kw):
-        super(CementConfigHandler, self).__init__(*args, **kw)              
-        
\ No newline at end of file
+    def parse_files(self, file_paths):
+        """
+        Parse config file settings from each of `file_paths` in order, later
+        files overriding earlier ones.  Files that do not exist are skipped.
+        This is not part of the IConfig interface, the framework falls back
+        to calling parse_file() per file for handlers that don't have it.
+        
+        :param file_paths: A list of config file paths.
+        :returns: A list of booleans, as returned by parse_file() for each 
+            path.
+        :rtype: list
+        
+        """
+        return [self.parse_file(file_path) for file_path in file_paths]
+        
+    # shared by all config handlers: cache key (see _parse_cache_key()) ->
+    # ((mtime, size), parsed data)
+    _parse_cache = OrderedDict()
+    
+    def _parse_cache_key(self, file_path):
+        """
+        Return the key that the parsed data of `file_path` is cached under.
+        The parsed data depends on the handler class as well as the file, 
+        implementations with per-instance parsing options should extend the
+        key with them.
+        
+        :param file_path: The path of the config file.
+        :returns: A hashable cache key.
+        
+        """
+        return (self.__class__, os.path.realpath(file_path))
+        
+    def _get_cached_parse(self, file_path, stat):
+        """
+        Return the data previously cached for `file_path` by 
+        _cache_parse(), or None if nothing is cached or the file has been
+        modified since.
+        
+        :param file_path: The path of the config file.
+        :param stat: The os.stat() result for `file_path`.
+        :returns: The cached data, or None.
+        
+        """
+        key = self._parse_cache_key(file_path)
+        entry = self._parse_cache.pop(key, None)
+        if entry is None or entry[0] != _file_version(stat):
+            return None
+        
+        # re-insert to mark as most recently used
+        self._parse_cache[key] = entry
+        return entry[1]
+        
+    def _cache_parse(self, file_path, stat, data):
+        """
+        Cache the parsed `data` of `file_path`, dropping the least recently
+        used entry once more than PARSE_CACHE_SIZE files are cached.
+        
+        :param file_path: The path of the config file.
+        :param stat: The os.stat() result for `file_path`.
+        :param data: The parsed data, in whatever form the implementation 
+            needs to apply it again.
+        
+        """
+        key = self._parse_cache_key(file_path)
+        self._parse_cache[key] = (_file_version(stat), data)
+        if len(self._parse_cache) > PARSE_CACHE_SIZE:
+            self._parse_cache.popitem(last=False)
@@ -3,9 +3,6 @@
 import sys
 from ..core import backend, exc, interface, handler
 
-if sys.version_info[0] >= 3:
-    from imp import reload # pragma: no cover
-    
 LOG = backend.minimal_logger(__name__)
     
 def extension_validator(klass, obj):
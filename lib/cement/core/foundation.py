@@ -4,24 +4,58 @@ import re
 import os
 import sys
 import signal
+import importlib
 
 from ..core import backend, exc, handler, hook, log, config, plugin
 from ..core import output, extension, arg, controller, meta, cache
-from ..ext import ext_configparser, ext_argparse, ext_logging
-from ..ext import ext_nulloutput, ext_plugin
 
 if sys.version_info[0] >= 3: 
-    from imp import reload  # pragma: nocover
+    from importlib import reload  # pragma: nocover
     
 LOG = backend.minimal_logger(__name__)    
+
+# alpha-numeric (\w also covers underscores), or dashes
+_LABEL_RE = re.compile(r'\A[\w-]+\Z')
     
 class NullOut(object):
+    __slots__ = ()
+    
     def write(self, s):
         pass
     
     def flush(self):
         pass
         
+_NULL_OUT = NullOut()
+        
+def _no_hooks(name):
+    """
+    Return whether the hook `name` is defined but has no hook functions
+    registered.  Undefined hooks return False so that hook.run() still 
+    raises for them.
+    
+    :param name: The name of the hook.
+    :rtype: boolean
+    
+    """
+    return name in backend.hooks and not backend.hooks[name]
+        
+def _run_hooks(name, *args):
+    """
+    Run all hook functions registered to `name`, discarding their results.
+    Unlike iterating over hook.run() directly, no generator is created when
+    no hook functions are registered (the common case).
+    
+    :param name: The name of the hook.
+    :param args: Arguments passed to the hook functions.
+    :raises: cement.core.exc.FrameworkError
+    
+    """
+    if _no_hooks(name):
+        return
+    for res in hook.run(name, *args):
+        pass
+        
 def cement_signal_handler(signum, frame):
     """
     Catch a signal, run the 'signal' hook, and then raise an exception 
@@ -34,8 +68,7 @@ def cement_signal_handler(signum, frame):
     """      
     LOG.debug('Caught signal %s' % signum)  
     
-    for res in hook.run('signal', signum, frame):
-        pass
+    _run_hooks('signal', signum, frame)
         
     raise exc.CaughtSignal(signum, frame)
                  
@@ -208,7 +241,7 @@ class CementApp(meta.MetaMixin):
         signal_handler = cement_signal_handler
         """A function that is called to handle any caught signals."""
         
-        config_handler = ext_configparser.ConfigParserConfigHandler
+        config_handler = 'fastconfigparser'
         """
         A handler class that implements the IConfig interface.  This can
         be a string (label of a registered handler), an uninstantiated
@@ -222,28 +255,28 @@ class CementApp(meta.MetaMixin):
         class, or an instantiated class object.
         """
         
-        log_handler = ext_logging.LoggingLogHandler
+        log_handler = 'logging'
         """
         A handler class that implements the ILog interface.  This can
         be a string (label of a registered handler), an uninstantiated
         class, or an instantiated class object.
         """
         
-        plugin_handler = ext_plugin.CementPluginHandler
+        plugin_handler = 'cement'
         """
         A handler class that implements the IPlugin interface.  This can
         be a string (label of a registered handler), an uninstantiated
         class, or an instantiated class object.
         """
         
-        argument_handler = ext_argparse.ArgParseArgumentHandler
+        argument_handler = 'argparse'
         """
         A handler class that implements the IArgument interface.  This can
         be a string (label of a registered handler), an uninstantiated
         class, or an instantiated class object.
         """
         
-        output_handler = ext_nulloutput.NullOutputHandler
+        output_handler = 'null'
         """
         A handler class that implements the IOutput interface.  This can
         be a string (label of a registered handler), an uninstantiated
@@ -287,6 +320,7 @@ class CementApp(meta.MetaMixin):
             'cement.ext.ext_nulloutput',
             'cement.ext.ext_plugin',
             'cement.ext.ext_configparser', 
+            'cement.ext.ext_fastconfigparser', 
             'cement.ext.ext_logging', 
             'cement.ext.ext_argparse',
             ]
@@ -382,15 +416,10 @@ class CementApp(meta.MetaMixin):
             raise exc.FrameworkError("Application name missing.")
         
         # validate the name is ok
-        ok = ['_', '-']
-        for char in self._meta.label:
-            if char in ok:
-                continue
-            
-            if not char.isalnum():
-                raise exc.FrameworkError(
-                    "App label can only contain alpha-numeric, dashes, or underscores."
-                    )
+        if not _LABEL_RE.match(self._meta.label):
+            raise exc.FrameworkError(
+                "App label can only contain alpha-numeric, dashes, or underscores."
+                )
                     
     def setup(self):
         """
@@ -411,16 +440,15 @@ class CementApp(meta.MetaMixin):
 
             if self._meta.bootstrap not in sys.modules \
                 or self._loaded_bootstrap is None:
-                __import__(self._meta.bootstrap, globals(), locals(), [], -1)
-                if hasattr(sys.modules[self._meta.bootstrap], 'load'):
-                    sys.modules[self._meta.bootstrap].load()
+                mod = importlib.import_module(self._meta.bootstrap)
+                if hasattr(mod, 'load'):
+                    mod.load()
 
-                self._loaded_bootstrap = sys.modules[self._meta.bootstrap]
+                self._loaded_bootstrap = mod
             else:
                 reload(self._loaded_bootstrap)
             
-        for res in hook.run('pre_setup', self):
-            pass
+        _run_hooks('pre_setup', self)
         
         self._setup_signals()
         self._setup_extension_handler()
@@ -433,8 +461,7 @@ class CementApp(meta.MetaMixin):
         self._setup_output_handler()
         self._setup_controllers()
 
-        for res in hook.run('post_setup', self):
-            pass
+        _run_hooks('post_setup', self)
              
     def run(self):
         """
@@ -442,8 +469,7 @@ class CementApp(meta.MetaMixin):
         called) to run the application.
         
         """
-        for res in hook.run('pre_run', self):
-            pass
+        _run_hooks('pre_run', self)
         
         # If controller exists, then pass controll to it
         if self.controller:
@@ -451,8 +477,7 @@ class CementApp(meta.MetaMixin):
         else:
             self._parse_args()
 
-        for res in hook.run('post_run', self):
-            pass
+        _run_hooks('post_run', self)
 
     def close(self):
         """
@@ -461,13 +486,11 @@ class CementApp(meta.MetaMixin):
         execution.
         
         """
-        for res in hook.run('pre_close', self):
-            pass
+        _run_hooks('pre_close', self)
             
         LOG.debug("closing the application")
 
-        for res in hook.run('post_close', self):
-            pass
+        _run_hooks('post_close', self)
             
     def render(self, data, template=None):
         """
@@ -479,11 +502,12 @@ class CementApp(meta.MetaMixin):
             output handlers do not use templates).
                 
         """
-        for res in hook.run('pre_render', self, data):
-            if not type(res) is dict:
-                LOG.debug("pre_render hook did not return a dict().")
-            else:
-                data = res
+        if not _no_hooks('pre_render'):
+            for res in hook.run('pre_render', self, data):
+                if not isinstance(res, dict):
+                    LOG.debug("pre_render hook did not return a dict().")
+                else:
+                    data = res
             
         if not self.output:
             LOG.debug('render() called, but no output handler defined.')
@@ -491,11 +515,12 @@ class CementApp(meta.MetaMixin):
         else:
             out_text = self.output.render(data, template)
             
-        for res in hook.run('post_render', self, out_text):
-            if not type(res) is str:
-                LOG.debug('post_render hook did not return a str()')
-            else:
-                out_text = str(res)
+        if not _no_hooks('post_render'):
+            for res in hook.run('post_render', self, out_text):
+                if not isinstance(res, str):
+                    LOG.debug('post_render hook did not return a str()')
+                else:
+                    out_text = res
         
         return out_text
         
@@ -517,20 +542,18 @@ class CementApp(meta.MetaMixin):
 
         # hacks to suppress console output
         suppress_output = False
-        if '--debug' in self._meta.argv:
+        argv = set(self._meta.argv)
+        if '--debug' in argv:
             self._meta.debug = True
-        else:
-            for flag in ['--quiet', '--json', '--yaml']:
-                if flag in self._meta.argv:
-                    suppress_output = True
-                    break
+        elif not argv.isdisjoint(['--quiet', '--json', '--yaml']):
+            suppress_output = True
 
         if suppress_output:
             LOG.debug('suppressing all console output per runtime config')
             backend.SAVED_STDOUT = sys.stdout
             backend.SAVED_STDERR = sys.stderr
-            sys.stdout = NullOut()
-            sys.stderr = NullOut()
+            sys.stdout = _NULL_OUT
+            sys.stderr = _NULL_OUT
             
         # start clean
         backend.hooks = {}
@@ -564,20 +587,24 @@ class CementApp(meta.MetaMixin):
     def _parse_args(self):
         self._parsed_args = self.args.parse(self.argv)
         
-        if self._meta.arguments_override_config is True:
-            for member in dir(self._parsed_args):
-                if member and member.startswith('_'):
-                    continue
+        if self._meta.arguments_override_config is not True:
+            return
+            
+        sections = self.config.get_sections()
+        section_keys = dict([(section, frozenset(self.config.keys(section))) \
+                             for section in sections])
+        for member, value in vars(self._parsed_args).items():
+            if member.startswith('_'):
+                continue
+        
+            # don't override config values for options that weren't passed
+            # or in otherwords are None
+            elif value is None:
+                continue
             
-                # don't override config values for options that weren't passed
-                # or in otherwords are None
-                elif getattr(self._parsed_args, member) is None:
-                    continue
-                
-                for section in self.config.get_sections():
-                    if member in self.config.keys(section):
-                        self.config.set(section, member, 
-                                        getattr(self._parsed_args, member))
+            for section in sections:
+                if member in section_keys[section]:
+                    self.config.set(section, member, value)
             
     def _setup_signals(self):
         if not self._meta.catch_signals:
@@ -585,6 +612,8 @@ class CementApp(meta.MetaMixin):
             return
             
         for signum in self._meta.catch_signals:
+            if signal.getsignal(signum) is self._meta.signal_handler:
+                continue
             LOG.debug("adding signal handler for signal %s" % signum)
             signal.signal(signum, self._meta.signal_handler)
     
@@ -604,15 +633,16 @@ class CementApp(meta.MetaMixin):
         
         """
         han = None
+        registered = backend.handlers.get(handler_type, {})
         if type(handler_def) == str:
             han = handler.get(handler_type, handler_def)()
         elif hasattr(handler_def, '_meta'):
-            if not handler.registered(handler_type, handler_def._meta.label):
+            if handler_def._meta.label not in registered:
                 handler.register(handler_def.__class__)
             han = handler_def
         elif hasattr(handler_def, 'Meta'):
             han = handler_def()
-            if not handler.registered(handler_type, han._meta.label):
+            if han._meta.label not in registered:
                 handler.register(handler_def)
             
         msg = "Unable to resolve handler '%s' of type '%s'" % \
@@ -645,19 +675,27 @@ class CementApp(meta.MetaMixin):
         
         if self._meta.config_files is None:
             label = self._meta.label
-            user_home = os.path.abspath(os.path.expanduser(os.environ['HOME']))
+            user_home = os.environ.get('HOME') or os.path.expanduser('~')
+            if not os.path.isabs(user_home):
+                user_home = os.path.abspath(os.path.expanduser(user_home))
             self._meta.config_files = [
-                os.path.join('/', 'etc', label, '%s.conf' % label),
-                os.path.join(user_home, '.%s.conf' % label),
-                os.path.join(user_home, '.%s' % label, 'config'),
+                '/etc/%s/%s.conf' % (label, label),
+                '%s/.%s.conf' % (user_home, label),
+                '%s/.%s/config' % (user_home, label),
                 ]
-        for _file in self._meta.config_files:
-            self.config.parse_file(_file)
+        # parse_files() is not part of IConfig, it comes from
+        # CementConfigHandler
+        if hasattr(self.config, 'parse_files'):
+            self.config.parse_files(self._meta.config_files)
+        else:
+            for _file in self._meta.config_files:
+                self.config.parse_file(_file)
         
         base_dict = self.config.get_section_dict(self._meta.config_section)
+        override_keys = frozenset(self._meta.core_meta_override).union(
+            self._meta.meta_override)
         for key in base_dict:
-            if key in self._meta.core_meta_override or \
-               key in self._meta.meta_override:
+            if key in override_keys:
                 setattr(self._meta, key, base_dict[key])
                                   
     def _setup_log_handler(self):
@@ -676,8 +714,14 @@ class CementApp(meta.MetaMixin):
 
         self.plugin = self._resolve_handler('plugin', 
                                             self._meta.plugin_handler)
-        self.plugin.load_plugins(self._meta.plugins)
-        self.plugin.load_plugins(self.plugin.get_enabled_plugins())
+        # load the Meta.plugins and the enabled plugins in one pass, loading
+        # plugins that appear in both only once (order is preserved)
+        plugin_list = []
+        for plugin_name in list(self._meta.plugins) + \
+                           list(self.plugin.get_enabled_plugins()):
+            if plugin_name not in plugin_list:
+                plugin_list.append(plugin_name)
+        self.plugin.load_plugins(plugin_list)
         
     def _setup_output_handler(self):
         if self._meta.output_handler is None:
@@ -725,17 +769,17 @@ class CementApp(meta.MetaMixin):
             controller = None
             
             # translate dashes to underscore
-            label = re.sub('-', '_', self.argv[0])
+            label = self.argv[0].replace('-', '_')
                                
             h = handler.get('controller', label, None)
             if h:
                 controller = h()
             else:
-                # controller aliases
+                # controller aliases, read from the Meta classes so that 
+                # only the matching controller gets instantiated
                 for han in handler.list('controller'):
-                    contr = han()
-                    if label in contr._meta.aliases:
-                        controller = contr
+                    if label in meta.get_class_meta(han, 'aliases', []):
+                        controller = han()
                         break
                     
             if controller:
@@ -29,33 +29,29 @@ class Attribute(object):
     def __repr__(self):
         return "<interface.Attribute - '%s'>" % self.description
         
-def validate(interface, obj, members=[], meta=DEFAULT_META):
+def validate(interface, obj, members=(), meta=DEFAULT_META):
     """
     A wrapper to validate interfaces.
     
     :param interface: The interface class to validate against
     :param obj: The object to validate.
-    :param members: The object members that must exist.
-    :param meta: The meta object members that must exist.
+    :param members: An iterable of the object members that must exist.
+    :param meta: An iterable of the meta object members that must exist.
     :raises: cement.core.exc.InterfaceError
             
     """
-    invalid = []
-
     if hasattr(obj, '_meta') and interface != obj._meta.interface:
         raise exc.InterfaceError("%s does not implement %s." % \
                                       (obj, interface))
         
-    for member in members:
-        if not hasattr(obj, member):
-            invalid.append(member)
+    invalid = [member for member in members if not hasattr(obj, member)]
     
     if not hasattr(obj, '_meta'):
         invalid.append("_meta")
     else:
-        for member in meta:
-            if not hasattr(obj._meta, member):
-                invalid.append("_meta.%s" % member)
+        _meta = obj._meta
+        invalid.extend(["_meta.%s" % member for member in meta \
+                        if not hasattr(_meta, member)])
             
     if invalid:
         raise exc.InterfaceError("Invalid or missing: %s in %s" % \
@@ -14,6 +14,34 @@ class Meta(object):
         for key in dict_obj.keys():
             setattr(self, key, dict_obj[key])
             
+def _get_meta_classes(klass):
+    """
+    Return all the Meta classes found in the MRO of `klass`, in the order
+    they are merged (base classes first).  The list only depends on the class
+    so it is cached on it.
+    
+    """
+    metas = klass.__dict__.get('_meta_classes')
+    if metas is None:
+        metas = [x.Meta for x in reversed(klass.mro()) if hasattr(x, "Meta")]
+        klass._meta_classes = metas
+    return metas
+    
+def get_class_meta(klass, key, default=None):
+    """
+    Return the meta value of `key` that instances of `klass` would get (when
+    not overridden by keyword arguments), without instantiating `klass`.
+    
+    :param klass: A MetaMixin sub-class.
+    :param key: The meta attribute name.
+    :param default: Returned if no Meta class defines `key`.
+    
+    """
+    for meta in reversed(_get_meta_classes(klass)):
+        if key in meta.__dict__:
+            return meta.__dict__[key]
+    return default
+    
 class MetaMixin(object):
     """
     Mixin that provides the Meta class support to add settings to instances
@@ -23,19 +51,19 @@ class MetaMixin(object):
 
     def __init__(self, *args, **kwargs):
         # Get a List of all the Classes we in our MRO, find any attribute named
-        #     Meta on them, and then merge them together in order of MRO
-        metas = reversed([x.Meta for x in self.__class__.mro() \
-                                  if hasattr(x, "Meta")])
+        #     Meta on them, and then merge them together in order of MRO.  The
+        #     Meta values are read per instance as they can be modified.
+        metas = _get_meta_classes(self.__class__)
         final_meta = {}
 
         # Merge the Meta classes into one dict
         for meta in metas:
-            final_meta.update(dict([x for x in meta.__dict__.items() \
-                                       if not x[0].startswith("_")]))
+            final_meta.update([x for x in meta.__dict__.items() \
+                                  if not x[0].startswith("_")])
 
         # Update the final Meta with any kwargs passed in
-        for key in final_meta.keys():
-            if key in kwargs:
+        for key in list(kwargs.keys()):
+            if key in final_meta:
                 final_meta[key] = kwargs.pop(key)
 
         self._meta = Meta(**final_meta)
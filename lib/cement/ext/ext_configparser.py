@@ -3,9 +3,9 @@
 import os
 import sys
 if sys.version_info[0] < 3:
-    from ConfigParser import RawConfigParser # pragma: no cover
+    from ConfigParser import RawConfigParser, NoSectionError # pragma: no cover
 else:
-    from configparser import RawConfigParser # pragma: no cover
+    from configparser import RawConfigParser, NoSectionError # pragma: no cover
 
 from ..core import backend, config, handler
 
@@ -60,29 +60,67 @@ class ConfigParserConfigHandler(config.CementConfigHandler, RawConfigParser):
                         self.set(section, key, dict_obj[section][key])
                     else:
                         # only set it if the key doesn't exist
-                        if not self.has_key(section, key):
+                        if not (section, key) in self:
                             self.set(section, key, dict_obj[section][key])
                             
                 # we don't support nested config blocks, so no need to go 
                 # further down to more nested dicts.
                 
+    def _parse_cache_key(self, file_path):
+        # allow_no_value and an optionxform set on the instance change what a
+        # file parses to
+        key = super(ConfigParserConfigHandler, self)._parse_cache_key(file_path)
+        return key + (self._optcre, self.__dict__.get('optionxform'))
+        
     def parse_file(self, file_path):
         """
         Parse config file settings from file_path, overwriting existing 
         config settings.  If the file does not exist, returns False.
         
+        The parsed settings are cached per file (see 
+        CementConfigHandler._cache_parse()), and reused as long as the
+        file's mtime and size are unchanged.
+        
         :param file_path: The file system path to the configuration file.
         :returns: boolean
         
         """
         file_path = os.path.abspath(os.path.expanduser(file_path))
-        if os.path.exists(file_path):
-            self.read(file_path)
-            return True
-        else:
+        try:
+            stat = os.stat(file_path)
+        except OSError:
             LOG.debug("config file '%s' does not exist, skipping..." % \
                       file_path)
             return False
+            
+        data = self._get_cached_parse(file_path, stat)
+        if data is None:
+            # parse into a clean handler so only this file's settings are
+            # cached, using the same parsing options as self
+            # (allow_no_value, dict_type, an instance optionxform, ...) but
+            # none of its parsed data
+            parser = self.__class__()
+            for name, value in self.__dict__.items():
+                if name not in ('_sections', '_defaults', '_proxies'):
+                    setattr(parser, name, value)
+            parser._sections = self._dict()
+            parser._defaults = self._dict()
+            parser.read(file_path)
+            sections = []
+            for section, options in parser._sections.items():
+                options = options.copy()
+                options.pop('__name__', None)
+                sections.append((section, options))
+            data = (parser._defaults.copy(), sections)
+            self._cache_parse(file_path, stat, data)
+        
+        defaults, sections = data
+        self._defaults.update(defaults)
+        for section, options in sections:
+            if not self.has_section(section):
+                self.add_section(section)
+            self._sections[section].update(options)
+        return True
      
     def keys(self, section):
         """
@@ -95,6 +133,20 @@ class ConfigParserConfigHandler(config.CementConfigHandler, RawConfigParser):
         """
         return self.options(section)
 
+    def __contains__(self, item):
+        """
+        Return whether or not `item` exists in the config.
+        
+        :param item: Either a (section, key) tuple, or a section label.
+        :returns: True if the config has the `key` in `section` (or the 
+            `section` itself).
+        :rtype: boolean
+        
+        """
+        if isinstance(item, tuple):
+            return self.has_option(*item)
+        return self.has_section(item)
+        
     def has_key(self, section, key):
         """
         Return whether or not a 'section' has the given 'key'.
@@ -105,10 +157,7 @@ class ConfigParserConfigHandler(config.CementConfigHandler, RawConfigParser):
         :rtype: boolean
         
         """
-        if key in self.options(section):
-            return True
-        else:
-            return False
+        return self.has_option(section, key)
      
     def get_sections(self):
         """
@@ -129,9 +178,15 @@ class ConfigParserConfigHandler(config.CementConfigHandler, RawConfigParser):
         :rtype: dict
                 
         """
-        dict_obj = dict()
-        for key in self.keys(section):
-            dict_obj[key] = self.get(section, key)
+        # copy the parsed values in one go rather than resolving each key via
+        # self.get(), section values take precedence over the [DEFAULT] ones
+        try:
+            section_dict = self._sections[section]
+        except KeyError:
+            raise NoSectionError(section)
+        dict_obj = dict(self._defaults)
+        dict_obj.update(section_dict)
+        dict_obj.pop('__name__', None)
         return dict_obj
 
     def add_section(self, section):
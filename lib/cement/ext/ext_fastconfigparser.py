@@ -0,0 +1,107 @@
+"""Fast ConfigParser Framework Extension."""
+
+import re
+import sys
+if sys.version_info[0] < 3:
+    from ConfigParser import RawConfigParser, DEFAULTSECT # pragma: no cover
+    from StringIO import StringIO # pragma: no cover
+else:
+    from configparser import RawConfigParser, DEFAULTSECT # pragma: no cover
+    from io import StringIO # pragma: no cover
+
+from ..core import backend, config, handler
+from .ext_configparser import ConfigParserConfigHandler
+
+LOG = backend.minimal_logger(__name__)
+
+_SECTION_RE = re.compile(r'\[([^]]+)\]')
+_OPTION_RE = re.compile(r'([^:=\s][^:=]*)[:=]\s*(.*)$')
+
+# the fast path follows the Python 2 ConfigParser syntax (inline ';' comments,
+# '""' meaning an empty value), Python 3 always uses the standard parser
+_FAST_PATH = sys.version_info[0] < 3
+
+class FastConfigParserConfigHandler(ConfigParserConfigHandler):
+    """
+    This class is an implementation of the
+    :ref:`IConfig <cement.core.config>` interface.  It is identical to
+    :ref:`ConfigParserConfigHandler <cement.ext.ext_configparser>`, except
+    that config files are read with a single pass over the file using two
+    precompiled expressions, storing values directly rather than collecting
+    lines for a later join.
+
+    Files using syntax the fast path does not handle (continuation lines,
+    option lines before any section, unparsable lines) are handed to the
+    standard RawConfigParser parser as a whole.
+    """
+    class Meta:
+        """Handler meta-data."""
+
+        interface = config.IConfig
+        """The interface that this handler implements."""
+
+        label = 'fastconfigparser'
+        """The string identifier of this handler."""
+
+    def _read(self, fp, fpname):
+        """
+        Parse a sectioned config file, called by RawConfigParser.read().
+
+        :param fp: The open file object to read from.
+        :param fpname: The file name (used in error messages).
+
+        """
+        if not _FAST_PATH or self._optcre is not self.OPTCRE:
+            return RawConfigParser._read(self, fp, fpname)
+
+        text = fp.read()
+        optionxform = self.optionxform
+        cursect = None
+        for line in text.split('\n'):
+            # comment or blank line?
+            if not line.strip() or line[0] in '#;':
+                continue
+            if line[0] in 'rR' and line.split(None, 1)[0].lower() == 'rem':
+                continue
+            # continuation lines need the standard parser
+            if line[0].isspace():
+                break
+
+            mo = _SECTION_RE.match(line)
+            if mo:
+                sectname = mo.group(1)
+                if sectname in self._sections:
+                    cursect = self._sections[sectname]
+                elif sectname == DEFAULTSECT:
+                    cursect = self._defaults
+                else:
+                    cursect = self._dict()
+                    cursect['__name__'] = sectname
+                    self._sections[sectname] = cursect
+                continue
+
+            mo = _OPTION_RE.match(line)
+            if cursect is None or mo is None:
+                break
+
+            optname, optval = mo.groups()
+            # ';' is a comment delimiter only if it follows a spacing
+            # character
+            pos = optval.find(';')
+            if pos != -1 and optval[pos-1].isspace():
+                optval = optval[:pos]
+            optval = optval.strip()
+            if optval == '""':
+                optval = ''
+            cursect[optionxform(optname.rstrip())] = optval
+        else:
+            return
+
+        # Re-reading the lines already applied above is harmless, they are
+        # set again to the same values in the same order.
+        LOG.debug("falling back to the standard parser for '%s'" % fpname)
+        RawConfigParser._read(self, StringIO(text), fpname)
+
+def load():
+    """Called by the framework when the extension is 'loaded'."""
+    handler.register(FastConfigParserConfigHandler)
@@ -151,13 +151,19 @@ class CementPluginHandler(plugin.CementPluginHandler):
         self.app._meta.plugin_bootstrap.
         
         Upon successful loading of a plugin, the plugin name is appended to
-        the self._loaded_plugins list.
+        the self._loaded_plugins list.  Plugins that are already loaded are
+        skipped.
         
         :param plugin_name: The name of the plugin to load.
         :type plugin_name: str
         :raises: cement.core.exc.FrameworkError
         
         """
+        if plugin_name in self._loaded_plugins:
+            LOG.debug("plugin '%s' is already loaded, skipping." % 
+                      plugin_name)
+            return
+            
         LOG.debug("loading application plugin '%s'" % plugin_name)
 
         # first attempt to load from plugin_dir, then from a bootstrap module
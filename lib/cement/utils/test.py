@@ -51,10 +51,8 @@ class CementTestCase(unittest.TestCase):
         Remove all registered hooks and handlers from the backend.
         
         """
-        for _handler in backend.handlers.copy():
-            del backend.handlers[_handler]
-        for _hook in backend.hooks.copy():
-            del backend.hooks[_hook]    
+        backend.handlers.clear()
+        backend.hooks.clear()
             
     def ok(self, expr, msg=None):
         """Shorthand for assert."""
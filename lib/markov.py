@@ -4,6 +4,7 @@ from __future__ import division
 import string
 import itertools
 import random
+import bisect
 from collections import defaultdict
 
 
@@ -86,14 +87,9 @@ def pairwise(iterable):
     >>> list(pairwise('abcd'))
     [('a', 'b'), ('b', 'c'), ('c', 'd')]
     """
-    iterator = iter(iterable)
-    try:
-        a = iterator.next()
-    except StopIteration:
-        return
-    for b in iterator:
-        yield a, b
-        a = b
+    a, b = itertools.tee(iterable)
+    next(b, None)
+    return itertools.izip(a, b)
 
 
 class MarkovChain(object):
@@ -114,43 +110,93 @@ class MarkovChain(object):
         for current, next in pairwise(sample):
             counts[current][next] += 1
         
+        # next states of each state with their cumulative weights, so that a
+        # next state can be picked by bisection
+        self._states = {}
+        self._cum_weights = {}
+        for current, next_counts in counts.iteritems():
+            states = next_counts.keys()
+            cum_weights = []
+            total = 0
+            for next_state in states:
+                total += next_counts[next_state]
+                cum_weights.append(total)
+            self._states[current] = states
+            self._cum_weights[current] = cum_weights
+        
         self.totals = dict(
-            (current, sum(next_counts.itervalues()))
-            for current, next_counts in counts.iteritems()
+            (current, cum_weights[-1])
+            for current, cum_weights in self._cum_weights.iteritems()
         )
         
+        # freeze the table, looking up an unknown state must not add it
+        self.counts = dict(
+            (current, dict(next_counts))
+            for current, next_counts in counts.iteritems()
+        )
+        self._keys = tuple(self.counts)
 
     def next(self, state):
         """
         Choose at random and return a next state from a current state,
         according to the probabilities for this chain
         """
-        nexts = self.counts[state].iteritems()
         # Like random.choice() but with a different weight for each element
-        rand = random.randrange(0, self.totals[state])
-        # Using bisection here could be faster, but simplicity prevailed.
-        # (Also it’s not that slow with 26 states or so.)
-        for next_state, weight in nexts:
-            if rand < weight:
-                return next_state
-            rand -= weight
+        cum_weights = self._cum_weights[state]
+        rand = random.randrange(0, cum_weights[-1])
+        return self._states[state][bisect.bisect_right(cum_weights, rand)]
+    
+    def sample(self, n, start=None):
+        """
+        Return a list of `n` consecutive states, starting after `start` (a
+        random state by default).  Same as taking `n` states from iter(self),
+        without the per-step method call and generator overhead.
+        """
+        if start is None:
+            start = random.choice(self._keys)
+        all_states = self._states
+        all_cum_weights = self._cum_weights
+        randrange = random.randrange
+        bisect_right = bisect.bisect_right
+        
+        states = []
+        state = start
+        for _ in xrange(n):
+            cum_weights = all_cum_weights[state]
+            rand = randrange(0, cum_weights[-1])
+            state = all_states[state][bisect_right(cum_weights, rand)]
+            states.append(state)
+        return states
     
     def __iter__(self):
         """
         Return an infinite iterator of states.
         """
-        state = random.choice(self.counts.keys())
+        state = random.choice(self._keys)
         while True:
             state = self.next(state)
             yield state
 
+# built once, the corpus never changes
+_CHAIN = MarkovChain(
+    c for c in cree.lower() if c in string.ascii_lowercase
+)
+
 def generateHandle():
-    chain = MarkovChain(
-        c for c in cree.lower() if c in string.ascii_lowercase
-    )
-    handle = ''.join(itertools.islice(chain, 6)) + "%s"%random.randint(10,999)
+    handle = ''.join(_CHAIN.sample(6)) + "%s"%random.randint(10,999)
     return handle.upper()
 
+def generateUniqueHandle(existing, tries=1000):
+    """
+    Return a handle from generateHandle() that is not in `existing` (a set
+    or dict of handles already taken).
+    """
+    for _ in xrange(tries):
+        handle = generateHandle()
+        if handle not in existing:
+            return handle
+    raise ValueError("no unique handle found in %d tries" % tries)
+
 if __name__ == '__main__':
     print generateHandle()
 
@@ -397,18 +397,27 @@ class Command(Node):
             if option.default is not missing:
                 options[name] = option.default
         result = options, []
+        # the option lookup tables are built on first use and then reused
+        # for every following option instead of being rebuilt per argument
+        short_options = long_options = None
         argument_iter = enumerate(arguments)
         for i, argument in argument_iter:
             if argument.startswith(u"--"):
+                if long_options is None:
+                    long_options = self.long_options
                 callpath.append((argument, None))
                 options.update(self.evaluate_long_option(callpath,
                                                          argument[2:],
-                                                         argument_iter))
+                                                         argument_iter,
+                                                         long_options))
             elif argument.startswith(u"-"):
+                if short_options is None:
+                    short_options = self.short_options
                 callpath.append((argument, None))
                 options.update(self.evaluate_short_options(callpath,
                                                            list(argument[1:]),
-                                                           argument_iter))
+                                                           argument_iter,
+                                                           short_options))
             else:
                 try:
                     name, command = self.all_commands[arguments[i]]
@@ -424,11 +433,14 @@ class Command(Node):
                 return {name: result}, []
         return result
 
-    def evaluate_short_options(self, callpath, shorts, arguments):
+    def evaluate_short_options(self, callpath, shorts, arguments,
+                               short_options=None):
+        if short_options is None:
+            short_options = self.short_options
         result = {}
         for short in shorts:
             try:
-                name, option = self.short_options[short]
+                name, option = short_options[short]
             except KeyError:
                 self.print_missing_node(u"-" + short, callpath)
             callpath[-1] = (callpath[-1][0], option)
@@ -445,9 +457,12 @@ class Command(Node):
                 result[name] = option.evaluate(callpath)
         return result
 
-    def evaluate_long_option(self, callpath, long, arguments):
+    def evaluate_long_option(self, callpath, long, arguments,
+                             long_options=None):
+        if long_options is None:
+            long_options = self.long_options
         try:
-            name, option = self.long_options[long]
+            name, option = long_options[long]
         except KeyError:
             self.print_missing_node(callpath[-1][0], callpath)
         callpath[-1] = (callpath[-1][0], option)
@@ -567,14 +582,42 @@ class HelpCommand(Command):
         sys.exit(1)
 
 class Parser(Command):
+    """
+    The top-level command evaluating ``sys.argv``.
+
+    The values of the given ``options`` dictionary may either be options or
+    zero-argument callables returning an option, the latter are only called
+    once the options are actually needed.
+    """
     def __init__(self, options=None, commands=None, script_name=None,
                  description=None, out_file=sys.stdout, takes_arguments=None):
-        Command.__init__(self, options=options, commands=commands,
+        self._option_factories = {}
+        Command.__init__(self, commands=commands,
                          long_description=description,
                          takes_arguments=takes_arguments)
+        # after Command.__init__(), assigning self.options discards them
+        self._option_factories = options or {}
         self.script_name = sys.argv[0] if script_name is None else script_name
         self.out_file = out_file
 
+    @property
+    def options(self):
+        """
+        A dictionary mapping the names of the options to the options.
+        """
+        if self._option_factories:
+            factories, self._option_factories = self._option_factories, {}
+            for name, factory in factories.iteritems():
+                if not isinstance(factory, Option):
+                    factory = factory()
+                self._options[name] = factory
+        return self._options
+
+    @options.setter
+    def options(self, options):
+        self._option_factories = {}
+        self._options = options
+
     @property
     def out_file(self):
         """
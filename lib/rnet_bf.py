@@ -1,23 +1,80 @@
 from blowfish import Blowfish
+import os
+import struct
 import hashlib
+import threading
+from collections import OrderedDict
+
+# Blowfish key setup is expensive, keep the ciphers of recently used keys
+# (Blowfish key -> Blowfish)
+CIPHER_CACHE_SIZE = 16
+_ciphers = OrderedDict()
+# a cached cipher keeps its CTR counter between initCTR() and
+# encryptCTR()/decryptCTR(), hold this lock for the cache and the whole
+# operation
+_lock = threading.Lock()
+
+def _cipher(bf_key):
+    # call with _lock held
+    cipher = _ciphers.pop(bf_key, None)
+    if cipher is None:
+        cipher = Blowfish(bf_key)
+        if len(_ciphers) >= CIPHER_CACHE_SIZE:
+            _ciphers.popitem(last=False)
+    _ciphers[bf_key] = cipher
+    return cipher
+
+def _key(key):
+    # 40 hex characters
+    return hashlib.sha1(key).hexdigest()
+
+def _key_v2(key):
+    # the 32 raw digest bytes (Blowfish takes up to 56), not compatible with
+    # encrypt()/decrypt()
+    return hashlib.sha256(key).digest()
+
+# v2 messages start with the random initial counter value (IV) they were
+# encrypted with, so no two messages under one key share a keystream
+IV_SIZE = 8
+_iv = struct.Struct('>Q')
 
 def encrypt(key, data):
-    h = hashlib.sha1()
-    h.update(key)
-    cipher = Blowfish(h.hexdigest())
-    cipher.initCTR()
-    return cipher.encryptCTR(data)
+    bf_key = _key(key)
+    with _lock:
+        cipher = _cipher(bf_key)
+        cipher.initCTR()
+        return cipher.encryptCTR(data)
 def decrypt(key, edata):
-    h = hashlib.sha1()
-    h.update(key)
-    cipher = Blowfish(h.hexdigest())
-    cipher.initCTR()
-    return cipher.decryptCTR(edata)
+    bf_key = _key(key)
+    with _lock:
+        cipher = _cipher(bf_key)
+        cipher.initCTR()
+        return cipher.decryptCTR(edata)
+
+def encrypt_v2(key, data):
+    bf_key = _key_v2(key)
+    iv = os.urandom(IV_SIZE)
+    with _lock:
+        cipher = _cipher(bf_key)
+        cipher.initCTR(_iv.unpack(iv)[0])
+        return iv + cipher.encryptCTR(data)
+def decrypt_v2(key, edata):
+    if len(edata) < IV_SIZE:
+        raise ValueError("encrypted data is shorter than its IV")
+    bf_key = _key_v2(key)
+    iv, edata = edata[:IV_SIZE], edata[IV_SIZE:]
+    with _lock:
+        cipher = _cipher(bf_key)
+        cipher.initCTR(_iv.unpack(iv)[0])
+        return cipher.decryptCTR(edata)
 
 if __name__ == '__main__':
     e = encrypt('password', 'Secret message')
     print repr(e)
     print repr(decrypt('password', e))
-    
-    
-    
\ No newline at end of file
+    e = encrypt_v2('password', 'Secret message')
+    print repr(e)
+    print repr(decrypt_v2('password', e))
+
+
+
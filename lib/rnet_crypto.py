@@ -3,45 +3,41 @@
 ##
 ##
 
-import unicodedata
 import rsa
 from rsa import bigfile, varblock, pkcs1
 import zlib
+import base64
+import struct
 from rs import RSCoder
-from StringIO import StringIO
+from cStringIO import StringIO
 
 class crypto:
+    # RSCoder(255, 127) shared by all instances, it keeps no state between
+    # calls and building its generator polynomials is costly
+    _rs = None
+    def _rscoder(self):
+        if crypto._rs is None:
+            crypto._rs = RSCoder(255, 127)
+        return crypto._rs
     def numencode(self, data):
-        c = 0
-        out = ""
-        for i in data:
-            out = out + "%03d "%ord(i)
-            c = c + 1
-            if c > 10:
-                c = 0
-                out = out + "\n"
-        return out + "\n"
+        nums = ["%03d "%i for i in bytearray(data)]
+        # 11 numbers per line
+        for i in range(10, len(nums), 11):
+            nums[i] = nums[i] + "\n"
+        return "".join(nums) + "\n"
     def numdecode(self, data):
-        nums = data.split(" ")
-        out = ""
-        for i in nums:
-            n = i.strip()
-            if not n:
-                continue
-            out = out + chr(int(n))
-        return out
+        return "".join([chr(int(n)) for n in data.split()])
     def compress(self, data):
         return zlib.compress(data)
     def uncompress(self, data):
         return zlib.decompress(data)
     def protect(self, data):
-        c = RSCoder(255, 127)
-        return c.encode(data)
-    def getprotected(self, data):
-        c = RSCoder(255, 127)
-        return c.decode(data)
+        return self._rscoder().encode(data)
+    def getprotected(self, data, nostrip=False):
+        # with nostrip the full 127 bytes are returned, leading NULs included
+        return self._rscoder().decode(data, nostrip)
     def encrypt(self, data, key):
-        if type(data) == type(u""):
+        if isinstance(data, unicode):
             infile = StringIO(data.encode('utf8'))
         else:
             infile = StringIO(data)
@@ -54,21 +50,55 @@ class crypto:
         bigfile.decrypt_bigfile(infile, outfile, key)
         return outfile.getvalue()
     def chunks(self, data, n):
-        for start in range(0, len(data), n):
-            yield data[start:start+n]
+        # memoryview slices don't copy the data, use chunk.tobytes() where a
+        # string is needed
+        view = memoryview(data)
+        for start in range(0, len(view), n):
+            yield view[start:start+n]
+    def _unprotect(self, buf, nostrip=False):
+        chunks = self.chunks(buf, 255)
+        # RSCoder.decode() returns slices of its input, so it needs strings
+        return "".join([self.getprotected(chunk.tobytes(), nostrip)
+                        for chunk in chunks])
     def encode(self, data, key):
         buf = self.compress(self.encrypt(data, key))
-        out = ""
-        for chunk in self.chunks(buf, 127):
-            out = out + self.numencode(self.protect(chunk))
-        return out
+        numencode = self.numencode
+        protect = self.protect
+        return "".join([numencode(protect(chunk))
+                        for chunk in self.chunks(buf, 127)])
     def decode(self, data, key):
-        buf = self.numdecode(data)
-        chunks = self.chunks(buf, 255)
-        buf2 = ""
-        for chunk in chunks:
-            buf2 = buf2 + self.getprotected(chunk)
+        buf2 = self._unprotect(self.numdecode(data))
         return self.decrypt(self.uncompress(buf2), key)
+    # Same pipeline as encode()/decode(), except that the plain text is
+    # compressed before it is encrypted (RSA output is random and won't
+    # compress), and the protected chunks are written as base64 (76
+    # characters per line) rather than numencode()'s decimal numbers, a third
+    # of the size.  The two formats are not interchangeable.
+    #
+    # RSCoder.decode() strips leading NUL bytes off a block by default, which
+    # loses data from any chunk that starts with one.  v2 prefixes the
+    # ciphertext with its length, pads it to whole 127-byte chunks and
+    # decodes every block with nostrip.
+    _V2_LENGTH = struct.Struct('>I')
+    def encode_v2(self, data, key):
+        if isinstance(data, unicode):
+            data = data.encode('utf8')
+        buf = self.encrypt(self.compress(data), key)
+        buf = self._V2_LENGTH.pack(len(buf)) + buf
+        buf = buf + "\0" * (-len(buf) % 127)
+        protect = self.protect
+        return base64.encodestring("".join([protect(chunk)
+                                            for chunk in self.chunks(buf, 127)]))
+    def decode_v2(self, data, key):
+        buf2 = self._unprotect(base64.decodestring(data), nostrip=True)
+        header = self._V2_LENGTH.size
+        if len(buf2) < header:
+            raise ValueError("encoded data is too short")
+        length = self._V2_LENGTH.unpack(buf2[:header])[0]
+        if len(buf2) - header < length:
+            raise ValueError("encoded data is truncated")
+        buf2 = buf2[header:header+length]
+        return self.uncompress(self.decrypt(buf2, key))
             
 
 
@@ -96,3 +126,6 @@ if __name__ == '__main__':
     a6 = c.encode(u"Большая-пребольшая тайна.", pub_key)
     print a6
     print c.decode(a6, priv_key)
+    a7 = c.encode_v2(u"Большая-пребольшая тайна.", pub_key)
+    print a7
+    print c.decode_v2(a7, priv_key)
@@ -1,15 +1,54 @@
 # -*- coding: utf8 -*-
 
+import sys
+import threading
 import rsa
 
-class RSA:
-    def __init__(self):
-        self.priv_key = None
-        self.pub_key  = None
+class RSA(object):
+    def __init__(self, background=False):
+        # with background=True, _generateRSA() returns at once and the keys
+        # are generated in a thread, pub_key/priv_key wait for it
+        self.background = background
+        self._keygen = None
+        self._keygen_error = None
+        self._priv_key = None
+        self._pub_key  = None
+    def _wait(self):
+        if self._keygen is not None:
+            self._keygen.join()
+            self._keygen = None
+            if self._keygen_error is not None:
+                exc_info, self._keygen_error = self._keygen_error, None
+                raise exc_info[0], exc_info[1], exc_info[2]
+    def _newkeys(self):
+        try:
+            self._pub_key, self._priv_key = rsa.newkeys(1536)
+        except Exception:
+            self._keygen_error = sys.exc_info()
+    @property
+    def pub_key(self):
+        self._wait()
+        return self._pub_key
+    @pub_key.setter
+    def pub_key(self, key):
+        self._wait()
+        self._pub_key = key
+    @property
+    def priv_key(self):
+        self._wait()
+        return self._priv_key
+    @priv_key.setter
+    def priv_key(self, key):
+        self._wait()
+        self._priv_key = key
     def _generateRSA(self):
-        self.pub_key, self.priv_key = rsa.newkeys(1536)
+        self._wait()
+        if self.background:
+            self._keygen = threading.Thread(target=self._newkeys)
+            self._keygen.daemon = True
+            self._keygen.start()
+        else:
+            self._pub_key, self._priv_key = rsa.newkeys(1536)
     def _loadRSA(self, pub, priv):
         self.priv_key = rsa.key.PrivateKey.load_pkcs1(priv)
         self.pub_key = rsa.key.PublicKey.load_pkcs1(pub)
-
-    
\ No newline at end of file